@@ -1,14 +1,16 @@
 from PySide6 import QtWidgets, QtCore, QtGui
 
 import json
+from dataclasses import dataclass
+from importlib.resources import files
 
 
-class Material(object):
-    def __init__(self, name, HB_min, HB_max, k_factor):
-        self.name = name
-        self.HB_min = HB_min
-        self.HB_max = HB_max
-        self.k_factor = k_factor
+@dataclass(slots=True, frozen=True)
+class Material:
+    name: str
+    HB_min: str
+    HB_max: str
+    k_factor: float
 
     def get_name(self):
         if self.HB_max == self.HB_min:
@@ -18,8 +20,10 @@ class Material(object):
 
 materials = []
 
-with open("src/components/materials.json") as file:
-    data = json.load(file)
+# Read the table as a package resource so it is found from any working directory
+data = json.loads(
+    files("src.components").joinpath("materials.json").read_text(encoding="utf-8")
+)
 
 sorted_materials = sorted(data, key=lambda x: x["material"])
 
@@ -49,10 +49,49 @@ def SFM_to_SMM(SFM):
     return SFM * 0.3048
 
 
-print(thou_to_mm(1))
+def calculate_results(diameter, flute_num, doc, woc, smm, mmpt, k_factor):
+    """
+    Calculate the cutting results from the tool, cutting and material values.
+
+    Args:
+        diameter (float): The cutting diameter of the tool in millimeters.
+        flute_num (int): The number of flutes on the tool.
+        doc (float): The depth of cut in millimeters.
+        woc (float): The width of cut in millimeters.
+        smm (float): The surface speed in meters per minute.
+        mmpt (float): The chip load in millimeters per tooth.
+        k_factor (float): The material K-factor.
+
+    Returns:
+        tuple: The RPM, the feed in mm/min, the material removal rate in cm³/min and the power in kW.
+
+    """
+    rpm = (smm * 1000) / (diameter * math.pi)
+    feed = float(flute_num) * mmpt * rpm
+    mrr = woc * doc * feed / 1000
+    kw = mrr / k_factor
+    return rpm, feed, mrr, kw
 
 
 class FeedsAndSpeeds:
+    __slots__ = (
+        "hb_min",
+        "hb_max",
+        "k_factor",
+        "diameter",
+        "flute_num",
+        "flute_len",
+        "lead_angle",
+        "doc",
+        "woc",
+        "smm",
+        "mmpt",
+        "rpm",
+        "feed",
+        "mrr",
+        "kw",
+    )
+
     def __init__(self):
         # Material
         self.hb_min = None
@@ -74,7 +113,8 @@ class FeedsAndSpeeds:
         # results
         self.rpm = None
         self.feed = None
-        self.mmr = None
+        self.mrr = None
+        self.kw = None
 
     def print_values(self):
         print("\nHB Min:", self.hb_min)
@@ -90,10 +130,15 @@ class FeedsAndSpeeds:
         print("Millimeters per tooth:", self.mmpt)
 
     def calculate(self):
-        self.rpm = (self.smm * 1000) / (self.diameter * math.pi)
-        self.feed = float(self.flute_num) * self.mmpt * self.rpm
-        self.mrr = self.woc * self.doc * self.feed / 1000
-        self.kw = self.mrr / self.k_factor
+        self.rpm, self.feed, self.mrr, self.kw = calculate_results(
+            self.diameter,
+            self.flute_num,
+            self.doc,
+            self.woc,
+            self.smm,
+            self.mmpt,
+            self.k_factor,
+        )
 
 
 # SFM = (Pi * RPM * Diameter) / 12
@@ -1,6 +1,8 @@
 import sys
 import os
 import logging
+from dataclasses import dataclass
+from typing import Final
 
 from PySide6 import QtWidgets, QtCore, QtGui
 
@@ -9,14 +11,28 @@ from src.components.widgets import MaterialCombo, IntInput, DoubleInput
 if os.name == "nt":
     import qdarktheme
 
-from src.formulas import FeedsAndSpeeds
+from src.formulas import calculate_results
 
-IN_TO_MM = 25.4
-MM_TO_IN = 0.0393701
-FT_TO_M = 0.3048
-FT_TO_MM = 304.8
-MM_TO_FT = 0.00328084
-M_TO_FT = 3.28084
+IN_TO_MM: Final = 25.4
+MM_TO_IN: Final = 1 / IN_TO_MM
+FT_TO_M: Final = 0.3048
+FT_TO_MM: Final = 304.8
+MM_TO_FT: Final = 1 / FT_TO_MM
+M_TO_FT: Final = 1 / FT_TO_M
+M_TO_MM: Final = 1000.0
+MM_TO_M: Final = 1 / M_TO_MM
+KW_TO_HP: Final = 1.34102
+
+SETTINGS_ORG = "speeds-and-feeds-calc"
+SETTINGS_APP = "SpeedsAndFeedsCalculator"
+
+
+@dataclass(slots=True, frozen=True)
+class ResultsState:
+    rpm: float
+    feed: float
+    mrr: float
+    kw: float
 
 
 class ToolBox(QtWidgets.QGroupBox):
@@ -57,64 +73,52 @@ class ToolBox(QtWidgets.QGroupBox):
 
 
 class CuttingBox(QtWidgets.QGroupBox):
-    def __init__(self, parent=None):
+    # Attribute, row label, decimals, maximum, single step, initial value.
+    # None adds a spacer row between the groups.
+    SPINBOXES = [
+        ("DOC", "Depth Of Cut (MM)", 2, 99.99, 1.0, 0.5),
+        ("DOC_IMP", "Depth Of Cut (Inches)", 2, 99.99, 1.0, 0.0),
+        ("DOC_percent", "Depth Of Cut (%)", 2, 200, 1.0, 0.0),
+        None,
+        ("WOC", "Width Of Cut (MM)", 2, 99.99, 1.0, 11),
+        ("WOC_IMP", "Width Of Cut (Inches)", 2, 99.99, 1.0, 0.0),
+        ("WOC_percent", "Width Of Cut (%)", 2, 100, 1.0, 0.0),
+        None,
+        ("SFM", "Surface Feet per Minute (SFM)", 2, 10000, 1.0, 1312.34),
+        ("SMMM", "Surface Millimeters per Minute (SMMM)", 2, 1000000, 1.0, 0.0),
+        ("SMM", "Surface Meters per Minute (SMM)", 2, 10000, 1.0, 0.0),
+        None,
+        ("IPT", "Inches per Tooth (IPT)", 4, 99.99, 0.001, 0.001),
+        ("MMPT", "Millimeters per tooth (MMPT)", 4, 99.99, 0.001, 0.0),
+    ]
+
+    def __init__(self, parent, tool_box):
         super(CuttingBox, self).__init__(parent)
         self.setTitle("Cutting Operation")
         form = QtWidgets.QFormLayout()
         self.setLayout(form)
         self.paused = False
 
+        # Keep the tool diameter locally rather than walking the parents on every edit
+        self._diameter = tool_box.toolDiameter.value()
+        tool_box.toolDiameter.valueChanged.connect(self.set_diameter)
+
         # Widgets
-        self.DOC = QtWidgets.QDoubleSpinBox()
-        self.DOC_IMP = QtWidgets.QDoubleSpinBox()
-        self.DOC_percent = QtWidgets.QDoubleSpinBox()
-        self.WOC = QtWidgets.QDoubleSpinBox()
-        self.WOC_IMP = QtWidgets.QDoubleSpinBox()
-        self.WOC_percent = QtWidgets.QDoubleSpinBox()
-        self.SFM = QtWidgets.QDoubleSpinBox()
-        self.SMM = QtWidgets.QDoubleSpinBox()
-        self.SMMM = QtWidgets.QDoubleSpinBox()
-        self.IPT = QtWidgets.QDoubleSpinBox()
-        self.MMPT = QtWidgets.QDoubleSpinBox()
-        self.IPT.setDecimals(4)
-        self.IPT.setMinimum(0.000)
-        self.IPT.setSingleStep(0.001)
-        self.MMPT.setDecimals(4)
-        self.MMPT.setSingleStep(0.001)
-        self.MMPT.setMinimum(0.000)
-        self.SFM.setMaximum(10000)
-        self.SMM.setMaximum(10000)
-        self.SMMM.setMaximum(1000000)
-        self.WOC_percent.setMaximum(100)
-        self.DOC_percent.setMaximum(200)
-
-        self.DOC.setValue(0.5)
-        self.WOC.setValue(11)
-        self.SFM.setValue(1312.34)
-        self.IPT.setValue(0.001)
-
-        spacer1 = QtWidgets.QWidget()
-        spacer1.setFixedHeight(10)  # Set the desired height for the spacer
-        spacer2 = QtWidgets.QWidget()
-        spacer2.setFixedHeight(10)  # Set the desired height for the spacer
-        spacer3 = QtWidgets.QWidget()
-        spacer3.setFixedHeight(10)  # Set the desired height for the spacer
-
-        form.addRow("Depth Of Cut (MM)", self.DOC)
-        form.addRow("Depth Of Cut (Inches)", self.DOC_IMP)
-        form.addRow("Depth Of Cut (%)", self.DOC_percent)
-        form.addRow(spacer1)
-        form.addRow("Width Of Cut (MM)", self.WOC)
-        form.addRow("Width Of Cut (Inches)", self.WOC_IMP)
-        form.addRow("Width Of Cut (%)", self.WOC_percent)
-        form.addRow(spacer2)
-        form.addRow("Surface Feet per Minute (SFM)", self.SFM)
-        form.addRow("Surface Millimeters per Minute (SMMM)", self.SMMM)
-        form.addRow("Surface Meters per Minute (SMM)", self.SMM)
-        form.addRow(spacer3)
-
-        form.addRow("Inches per Tooth (IPT)", self.IPT)
-        form.addRow("Millimeters per tooth (MMPT)", self.MMPT)
+        for spec in self.SPINBOXES:
+            if spec is None:
+                spacer = QtWidgets.QWidget()
+                spacer.setFixedHeight(10)  # Set the desired height for the spacer
+                form.addRow(spacer)
+                continue
+
+            name, label, decimals, maximum, step, value = spec
+            spinbox = QtWidgets.QDoubleSpinBox()
+            spinbox.setDecimals(decimals)
+            spinbox.setMaximum(maximum)
+            spinbox.setSingleStep(step)
+            spinbox.setValue(value)
+            setattr(self, name, spinbox)
+            form.addRow(label, spinbox)
 
         self.DOC.editingFinished.connect(self.doc_to_others)
         self.DOC_IMP.editingFinished.connect(self.doc_imp_to_others)
@@ -128,6 +132,9 @@ class CuttingBox(QtWidgets.QGroupBox):
         self.SMM.editingFinished.connect(self.smm_to_others)
         self.SMMM.editingFinished.connect(self.smmm_to_others)
 
+    def set_diameter(self, diameter):
+        self._diameter = diameter
+
     def init(self):
         self.doc_to_others()
         self.woc_to_others()
@@ -137,14 +144,14 @@ class CuttingBox(QtWidgets.QGroupBox):
         # Surface millimeters per minute
 
     def doc_imp_to_others(self):
-        diameter = self.parent().parent().tool_box.toolDiameter.value()
+        diameter = self._diameter
         doc_imp = self.DOC_IMP.value()
         doc = doc_imp * IN_TO_MM
         self.DOC_percent.setValue(doc / diameter * 100)
         self.DOC.setValue(doc)
 
     def woc_imp_to_others(self):
-        diameter = self.parent().parent().tool_box.toolDiameter.value()
+        diameter = self._diameter
         woc = self.WOC_IMP.value() * IN_TO_MM
         if woc > diameter:
             self.WOC.setValue(diameter)
@@ -153,13 +160,13 @@ class CuttingBox(QtWidgets.QGroupBox):
             self.WOC_percent.setValue(woc / diameter * 100)
 
     def doc_to_others(self):
-        diameter = self.parent().parent().tool_box.toolDiameter.value()
+        diameter = self._diameter
         doc = self.DOC.value()
         self.DOC_percent.setValue(doc / diameter * 100)
         self.DOC_IMP.setValue(doc * MM_TO_IN)
 
     def woc_to_others(self):
-        diameter = self.parent().parent().tool_box.toolDiameter.value()
+        diameter = self._diameter
         woc = self.WOC.value()
         if woc > diameter:
             self.WOC.setValue(diameter)
@@ -170,14 +177,14 @@ class CuttingBox(QtWidgets.QGroupBox):
         self.WOC_IMP.setValue(woc * MM_TO_IN)
 
     def doc_percent_to_others(self):
-        diameter = self.parent().parent().tool_box.toolDiameter.value()
+        diameter = self._diameter
         doc_percent = self.DOC_percent.value()
         mm = diameter * doc_percent / 100
         self.DOC.setValue(mm)
         self.DOC_IMP.setValue(mm * MM_TO_IN)
 
     def woc_percent_to_others(self):
-        diameter = self.parent().parent().tool_box.toolDiameter.value()
+        diameter = self._diameter
         woc_percent = self.WOC_percent.value()
         mm = diameter * woc_percent / 100
         self.WOC.setValue(mm)
@@ -199,12 +206,12 @@ class CuttingBox(QtWidgets.QGroupBox):
     def smm_to_others(self):
         smm = self.SMM.value()
         self.SFM.setValue(smm * M_TO_FT)
-        self.SMMM.setValue(smm * 1000)
+        self.SMMM.setValue(smm * M_TO_MM)
 
     def smmm_to_others(self):
         smmm = self.SMMM.value()
         self.SFM.setValue(smmm * MM_TO_FT)
-        self.SMM.setValue(smmm * 0.001)
+        self.SMM.setValue(smmm * MM_TO_M)
 
 
 class MachineBox(QtWidgets.QGroupBox):
@@ -227,6 +234,23 @@ class MachineBox(QtWidgets.QGroupBox):
 
 
 class ResultsBox(QtWidgets.QGroupBox):
+    # Label attribute, row text, column, ResultsState field, unit factor, value format
+    RESULTS = [
+        ("rpm", "RPM:", "left", "rpm", 1, "{:,.0f}"),
+        ("mrr", "Material Removal Rate (MRR):", "left", "mrr", 1, "{:.2f} cm³/min"),
+        ("kw", "Kilowatt Power:", "left", "kw", 1, "{:.2f} kW"),
+        ("hp", "Horse Power:", "left", "kw", KW_TO_HP, "{:.2f} HP"),
+        ("feed", "Feed (mm/min):", "right", "feed", 1, "{:.2f} mm/min"),
+        (
+            "feed_imp",
+            "Feed (inches/min):",
+            "right",
+            "feed",
+            MM_TO_IN,
+            "{:.2f} inches/min",
+        ),
+    ]
+
     def __init__(self, parent=None):
         super(ResultsBox, self).__init__(parent)
         self.setTitle("Results")
@@ -246,19 +270,24 @@ class ResultsBox(QtWidgets.QGroupBox):
         mainLayout.addStretch()
 
         # Widgets
-        self.rpm = QtWidgets.QLabel("<b>18,765</b>")
-        self.feed = QtWidgets.QLabel("<b>2000 mm/min</b>")
-        self.feed_imp = QtWidgets.QLabel("<b>2000 inches/min</b>")
-        self.mrr = QtWidgets.QLabel("<b>62 cm³/min</b>")
-        self.kw = QtWidgets.QLabel("<b>0.14 kw</b>")
-        self.hp = QtWidgets.QLabel("<b>0.14 kw</b>")
+        forms = {"left": formLeft, "right": formRight}
+        for name, text, column, _, _, _ in self.RESULTS:
+            label = QtWidgets.QLabel("<b>0</b>")
+            setattr(self, name, label)
+            forms[column].addRow(text, label)
+
+        self._prev_state = None
+
+    def update_values(self, state):
+        # Only touch the labels whose values changed since the last update
+        prev = self._prev_state
+
+        for name, _, _, field, factor, fmt in self.RESULTS:
+            value = getattr(state, field)
+            if prev is None or value != getattr(prev, field):
+                getattr(self, name).setText(f"<b>{fmt.format(value * factor)}</b>")
 
-        formLeft.addRow("RPM:", self.rpm)
-        formLeft.addRow("Material Removal Rate (MRR):", self.mrr)
-        formLeft.addRow("Kilowatt Power:", self.kw)
-        formLeft.addRow("Horse Power:", self.hp)
-        formRight.addRow("Feed (mm/min):", self.feed)
-        formRight.addRow("Feed (inches/min):", self.feed_imp)
+        self._prev_state = state
 
 
 class GUI(QtWidgets.QMainWindow):
@@ -269,15 +298,12 @@ class GUI(QtWidgets.QMainWindow):
         self.setWindowTitle(
             "Speeds and Feeds Calculator - https://github.com/bhowiebkr/Speeds-And-Feeds"
         )
-        settings = QtCore.QSettings("speeds-and-feeds-calc", "SpeedsAndFeedsCalculator")
+        settings = QtCore.QSettings(SETTINGS_ORG, SETTINGS_APP)
 
-        try:
-            self.restoreGeometry(settings.value("geometry"))
-
-        except Exception as e:
-            logging.warning(
-                "Unable to load settings. First time opening the tool?\n" + str(e)
-            )
+        # No saved geometry the first time the tool is opened
+        geometry = settings.value("geometry")
+        if geometry is not None:
+            self.restoreGeometry(geometry)
 
         # Layouts
         main_widget = QtWidgets.QWidget()
@@ -289,7 +315,7 @@ class GUI(QtWidgets.QMainWindow):
         form = QtWidgets.QFormLayout()
 
         self.tool_box = ToolBox(self)
-        self.cutting_box = CuttingBox(self)
+        self.cutting_box = CuttingBox(self, self.tool_box)
         self.machine_box = MachineBox(self)
 
         self.results_box = ResultsBox()
@@ -306,6 +332,14 @@ class GUI(QtWidgets.QMainWindow):
         sections_layout.addWidget(self.machine_box)
         main_layout.addWidget(self.results_box)
 
+        self._last_inputs = None
+
+        # Collapse all update requests in one event loop turn into one recalculation
+        self._update_timer = QtCore.QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(0)
+        self._update_timer.timeout.connect(self._do_update)
+
         # Logic
         self.materialCombo.currentIndexChanged.connect(self.update)
         self.tool_box.fluteNum.editingFinished.connect(self.update)
@@ -320,56 +354,48 @@ class GUI(QtWidgets.QMainWindow):
         self.tool_box.toolDiameterImp.editingFinished.connect(self.toolDiameterChanged)
 
         self.cutting_box.init()
-        self.update()
+        self._do_update()
 
     def toolDiameterChanged(self):
         self.cutting_box.init()
         self.update()
 
     def closeEvent(self, event):
-        self.settings = QtCore.QSettings(
-            "speeds-and-feeds-calc", "SpeedsAndFeedsCalculator"
-        )
+        self.settings = QtCore.QSettings(SETTINGS_ORG, SETTINGS_APP)
         self.settings.setValue("geometry", self.saveGeometry())
         QtWidgets.QWidget.closeEvent(self, event)
 
     def update(self):
-        print("update")
-
-        fs = FeedsAndSpeeds()
-
-        # Material
-        fs.hb_min = self.materialCombo.HBMin
-        fs.hb_max = self.materialCombo.HBMax
-        fs.k_factor = self.materialCombo.k_factor
-
-        # Tool
-        fs.diameter = self.tool_box.toolDiameter.value()
-        fs.flute_num = self.tool_box.fluteNum.value()
-        # fs.flute_len = self.tool_box.fluteLen.value()
-        # fs.lead_angle = self.tool_box.leadAngle.value()
+        if not self._update_timer.isActive():
+            self._update_timer.start()
+
+    def _do_update(self):
+        tool_box = self.tool_box
+        cutting_box = self.cutting_box
+        inputs = (
+            tool_box.toolDiameter.value(),
+            tool_box.fluteNum.value(),
+            cutting_box.DOC.value(),
+            cutting_box.WOC.value(),
+            cutting_box.SMM.value(),
+            cutting_box.MMPT.value(),
+            self.materialCombo.k_factor,
+        )
 
-        # Cutting
-        fs.doc = self.cutting_box.DOC.value()
-        fs.woc = self.cutting_box.WOC.value()
-        fs.smm = self.cutting_box.SMM.value()
-        fs.mmpt = self.cutting_box.MMPT.value()
+        # Nothing to do if the inputs are the same as the last update
+        if inputs == self._last_inputs:
+            return
+        self._last_inputs = inputs
 
-        # fs.print_values()
+        logging.debug("update")
 
         # Do the formulas
-        fs.calculate()
-
-        self.results_box.rpm.setText(f"<b>{round(fs.rpm):,}</b>")
-        self.results_box.feed.setText(f"<b>{fs.feed:.2f} mm/min</b>")
-        self.results_box.feed_imp.setText(f"<b>{fs.feed*0.0393701:.2f} inches/min</b>")
-        self.results_box.mrr.setText(f"<b>{fs.mrr:.2f} cm³/min</b>")
+        rpm, feed, mrr, kw = calculate_results(*inputs)
 
-        fs.kw = 0
-        self.results_box.kw.setText(f"<b>{fs.kw:.2f} kW</b>")
-        self.results_box.hp.setText(f"<b>{fs.kw * 1.34102:.2f} HP</b>")
+        kw = 0
 
         # Update the output
+        self.results_box.update_values(ResultsState(rpm=rpm, feed=feed, mrr=mrr, kw=kw))
 
 
 def start():